@@ -0,0 +1,37 @@
+"""
+Answer provider interface used by the game loop
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+ANSWER_CHOICES = ["Yes", "No", "Maybe", "I don't know"]
+
+class AnswerProvider(ABC):
+    
+    @abstractmethod
+    def confirm_ready(self) -> bool:
+        ...
+    
+    @abstractmethod
+    def answer_question(self, question: str) -> str:
+        ...
+    
+    @abstractmethod
+    def confirm_guess(self, country: str) -> bool:
+        ...
+    
+    @abstractmethod
+    def actual_country(self) -> Optional[str]:
+        ...
+
+def parse_answer(value: Any) -> str:
+    """Normalise a scripted answer to one of ANSWER_CHOICES"""
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    for choice in ANSWER_CHOICES:
+        if str(value).strip().lower() == choice.lower():
+            return choice
+    raise ValueError(f"Invalid answer: {value!r}. Expected one of {', '.join(ANSWER_CHOICES)}")
+
+def parse_confirmation(value: Any) -> bool:
+    return parse_answer(value) == "Yes"
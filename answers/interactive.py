@@ -0,0 +1,35 @@
+"""
+Interactive answers from the terminal
+"""
+from typing import Optional
+
+import questionary
+
+from answers.base import AnswerProvider, ANSWER_CHOICES
+
+class InteractiveAnswers(AnswerProvider):
+    
+    def confirm_ready(self) -> bool:
+        return questionary.confirm(
+            "🤔 Are you thinking of a country?",
+            default=True
+        ).ask()
+    
+    def answer_question(self, question: str) -> str:
+        return questionary.select(
+            "Your answer:",
+            choices=ANSWER_CHOICES,
+            style=questionary.Style([
+                ('selected', 'bg:cyan fg:black'),
+                ('pointer', 'fg:cyan bold'),
+            ])
+        ).ask()
+    
+    def confirm_guess(self, country: str) -> bool:
+        return questionary.confirm(
+            "Was my guess correct?",
+            default=True
+        ).ask()
+    
+    def actual_country(self) -> Optional[str]:
+        return questionary.text("What country were you thinking of?").ask()
@@ -0,0 +1,38 @@
+"""
+Answers derived from a hidden country's traits
+"""
+from typing import Optional
+
+from answers.base import AnswerProvider
+from logic.decision_tree import DecisionTree
+
+class OracleAnswers(AnswerProvider):
+    
+    def __init__(self, decision_tree: DecisionTree, country: str):
+        if country not in decision_tree.country_bits:
+            raise ValueError(f"Unknown country: {country}")
+        self.decision_tree = decision_tree
+        self.country = country
+        self.guessed: Optional[str] = None
+    
+    @property
+    def guessed_correctly(self) -> bool:
+        return self.guessed == self.country
+    
+    def confirm_ready(self) -> bool:
+        self.guessed = None
+        return True
+    
+    def answer_question(self, question: str) -> str:
+        question_data = self.decision_tree.questions_by_text.get(question)
+        if not question_data:
+            return "I don't know"
+        mask = self.decision_tree.match_masks[question_data["id"]]
+        return "Yes" if mask & self.decision_tree.country_bits[self.country] else "No"
+    
+    def confirm_guess(self, country: str) -> bool:
+        self.guessed = country
+        return country == self.country
+    
+    def actual_country(self) -> Optional[str]:
+        return self.country
@@ -0,0 +1,90 @@
+"""
+Non-interactive answers from a script file or a stream of JSON lines
+"""
+import json
+import sys
+from typing import Any, Callable, Iterable, List, Optional, TextIO, TypeVar
+
+from answers.base import AnswerProvider, parse_answer, parse_confirmation
+
+T = TypeVar("T")
+
+class ScriptedAnswers(AnswerProvider):
+    """Answer questions from a fixed list, falling back to "I don't know" when it runs out"""
+    
+    def __init__(self, answers: Iterable[str], ready: bool = True,
+                 correct: bool = False, country: Optional[str] = None):
+        self.answers: List[str] = [parse_answer(answer) for answer in answers]
+        self.ready = ready
+        self.correct = correct
+        self.country = country
+        self.position = 0
+    
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "ScriptedAnswers":
+        """Load one answer per line, ignoring blank lines and # comments"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = [line.strip() for line in f]
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Answer script {path} not found")
+        return cls([line for line in lines if line and not line.startswith("#")], **kwargs)
+    
+    def confirm_ready(self) -> bool:
+        # A fresh game replays the script from the start
+        self.position = 0
+        return self.ready
+    
+    def answer_question(self, question: str) -> str:
+        if self.position >= len(self.answers):
+            return "I don't know"
+        answer = self.answers[self.position]
+        self.position += 1
+        return answer
+    
+    def confirm_guess(self, country: str) -> bool:
+        return self.correct
+    
+    def actual_country(self) -> Optional[str]:
+        return self.country
+
+class JsonLinesAnswers(AnswerProvider):
+    """
+    Read one JSON value per prompt, e.g. `"Yes"`, `true` or `{"answer": "Maybe"}`.
+    Unreadable lines are skipped with a warning on stderr. End of input
+    declines to play, answers "I don't know" and rejects the guess.
+    """
+    
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdin
+        self.line_number = 0
+    
+    def _read(self, parse: Callable[[Any], T]) -> Optional[T]:
+        for line in iter(self.stream.readline, ""):
+            self.line_number += 1
+            if not line.strip():
+                continue
+            try:
+                value = json.loads(line)
+                if isinstance(value, dict):
+                    if "answer" not in value:
+                        raise ValueError('expected an object with an "answer" key')
+                    value = value["answer"]
+                return parse(value)
+            except ValueError as e:
+                # json.JSONDecodeError is a ValueError too
+                print(f"Skipping line {self.line_number}: {e}", file=sys.stderr)
+        return None
+    
+    def confirm_ready(self) -> bool:
+        return bool(self._read(parse_confirmation))
+    
+    def answer_question(self, question: str) -> str:
+        answer = self._read(parse_answer)
+        return "I don't know" if answer is None else answer
+    
+    def confirm_guess(self, country: str) -> bool:
+        return bool(self._read(parse_confirmation))
+    
+    def actual_country(self) -> Optional[str]:
+        return self._read(str)
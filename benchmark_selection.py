@@ -0,0 +1,184 @@
+""" Benchmark how many candidate questions the selector evaluates per turn, with and without precomputed stats """
+import argparse
+import random
+import time
+from typing import Dict, List, Tuple, Any
+
+from data.data_loader import load_country_data
+from logic.consistency import ConsistencyTracker
+from logic.decision_tree import DecisionTree
+
+def synthetic_bank(entities: int, seed: int) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """Build a large hierarchical dataset: continents contain regions, regions contain subregions"""
+    rng = random.Random(seed)
+    continents = [f"Continent {c}" for c in range(6)]
+    languages = [f"Language {l}" for l in range(24)]
+    religions = [f"Religion {r}" for r in range(8)]
+    exports = [f"Export {e}" for e in range(10)]
+
+    regions = {}
+    for c, continent in enumerate(continents):
+        for r in range(8):
+            regions[f"Region {c}.{r}"] = {
+                "continent": continent,
+                "hemisphere": "Northern" if c < 4 else "Southern",
+                "language_group": rng.choice(languages[c * 4:c * 4 + 4]),
+                "main_religion": rng.choice(religions[c:c + 3]),
+                "tropical": rng.random() < 0.3,
+                "desert": rng.random() < 0.2,
+                "monarchy": rng.random() < 0.3,
+                "eu_member": c == 0 and rng.random() < 0.6,
+            }
+
+    countries_data = {}
+    for i in range(entities):
+        region = rng.choice(list(regions))
+        coastline = rng.random() < 0.7
+        countries_data[f"Country {i}"] = dict(
+            regions[region],
+            region=region,
+            subregion=f"{region}.{rng.randrange(3)}",
+            coastline=coastline,
+            landlocked=not coastline,
+            mountains=rng.random() < 0.5,
+            major_exports=rng.sample(exports, 3),
+        )
+
+    questions = []
+    def add(trait: str, value: Any) -> None:
+        questions.append({
+            "id": f"q{len(questions)}",
+            "text": f"Is {trait} {value}?",
+            "trait": trait,
+            "match_value": value,
+            "category": "synthetic",
+        })
+
+    for trait in ("continent", "region", "subregion", "language_group", "main_religion"):
+        for value in sorted({data[trait] for data in countries_data.values()}):
+            add(trait, value)
+    add("hemisphere", "Northern")
+    for trait in ("coastline", "landlocked", "monarchy", "eu_member", "tropical", "desert", "mountains"):
+        add(trait, True)
+    for i, first in enumerate(exports):
+        add("major_exports", first)
+        for second in exports[i + 1:]:
+            add("major_exports", [first, second])
+
+    return countries_data, questions
+
+def paraphrased_bank(entities: int, seed: int) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Build a bank that grew by rewording: every attribute is asked several ways,
+    and each rewording is read differently for a few percent of the countries
+    """
+    rng = random.Random(seed)
+    attributes = 40
+    phrasings = 8
+
+    countries_data: Dict[str, Dict[str, Any]] = {}
+    rates = [rng.uniform(0.2, 0.5) for _ in range(attributes)]
+    for i in range(entities):
+        traits = {}
+        for a, rate in enumerate(rates):
+            value = rng.random() < rate
+            for p in range(phrasings):
+                # The first phrasing is the attribute itself
+                disagrees = p and rng.random() < rng.uniform(0.01, 0.03)
+                traits[f"attribute_{a}_{p}"] = value != bool(disagrees)
+        countries_data[f"Country {i}"] = traits
+
+    questions = [
+        {
+            "id": f"attribute_{a}_{p}",
+            "text": f"Phrasing {p} of attribute {a}?",
+            "trait": f"attribute_{a}_{p}",
+            "match_value": True,
+            "category": "synthetic",
+        }
+        for a in range(attributes)
+        for p in range(phrasings)
+    ]
+    return countries_data, questions
+
+def no_stats_tracker(tree: DecisionTree) -> ConsistencyTracker:
+    # Evaluates every unasked question each turn, like the selector before precomputed stats
+    return ConsistencyTracker(
+        tree.questions,
+        tree.match_masks,
+        (1 << len(tree.countries_data)) - 1,
+        {
+            "implies": {q["id"]: {"Yes": [], "No": []} for q in tree.questions},
+            "mutual_information": {q["id"]: {} for q in tree.questions},
+            "entropy": {q["id"]: 1.0 for q in tree.questions},
+            "redundant_groups": [],
+        }
+    )
+
+def play_games(tree: DecisionTree, games: int, max_questions: int) -> Dict[str, float]:
+    countries = list(tree.countries_data)
+    evaluated = turns = 0
+    elapsed = 0.0
+
+    for game in range(games):
+        target = countries[game % len(countries)]
+        tree.reset()
+        scores = {country: 0 for country in countries}
+        asked: List[Tuple[str, str]] = []
+
+        for _ in range(max_questions):
+            turns += 1
+            start = time.perf_counter()
+            question = tree.get_next_question(asked, scores)
+            elapsed += time.perf_counter() - start
+            if not question:
+                break
+
+            question_id = tree.questions_by_text[question]["id"]
+            answer = "Yes" if tree.match_masks[question_id] & tree.country_bits[target] else "No"
+            asked.append((question, answer))
+            tree.update_scores(question, answer, scores)
+
+            # Same stopping rule as CountryGuesser.play
+            top = sorted(scores.values(), reverse=True)[:2]
+            if top[0] > 0 and (top[0] - top[1]) / top[0] > 0.7:
+                break
+
+        evaluated += tree.candidates_evaluated
+
+    return {
+        "candidates": evaluated / max(1, turns),
+        "turn_ms": elapsed * 1000 / max(1, turns),
+        "turns": turns / max(1, games),
+    }
+
+def report(name: str, tree: DecisionTree, games: int, max_questions: int) -> None:
+    random.seed(0)
+    with_stats = play_games(tree, games, max_questions)
+    tree.consistency = no_stats_tracker(tree)
+    random.seed(0)
+    without_stats = play_games(tree, games, max_questions)
+
+    print(f"{name}: {len(tree.questions)} questions, {len(tree.countries_data)} countries, {games} games")
+    for label, result in (("without stats", without_stats), ("with stats", with_stats)):
+        print(f"  {label:14} {result['candidates']:7.1f} candidates/turn  "
+              f"{result['turn_ms']:7.3f} ms/turn  {result['turns']:5.1f} turns/game")
+    print(f"  reduction      {without_stats['candidates'] / max(1e-9, with_stats['candidates']):7.1f}x candidates, "
+          f"{without_stats['turn_ms'] / max(1e-9, with_stats['turn_ms']):.1f}x time")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=200, help="games per bank")
+    parser.add_argument("--entities", type=int, default=400, help="countries in the synthetic bank")
+    parser.add_argument("--max-questions", type=int, default=20, help="question limit per game")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic bank")
+    args = parser.parse_args()
+
+    report("Country dataset", DecisionTree(load_country_data()), args.games, args.max_questions)
+    countries_data, questions = synthetic_bank(args.entities, args.seed)
+    report("Hierarchical bank", DecisionTree(countries_data, questions), args.games, args.max_questions)
+    countries_data, questions = paraphrased_bank(args.entities, args.seed)
+    report("Paraphrased bank", DecisionTree(countries_data, questions), args.games, args.max_questions)
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,38 @@
-import time
 import json
 import os
-from typing import Dict, List, Tuple, Any
-
-import questionary
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.text import Text
+from typing import Dict, List, Tuple, Any, Optional
 
+from answers.base import AnswerProvider
+from frontend.base import Frontend
 from logic.decision_tree import DecisionTree
 
 class CountryGuesser:
     
-    def __init__(self, max_questions: int = 20):
-        self.console = Console()
+    def __init__(
+        self,
+        max_questions: int = 20,
+        frontend: Optional[Frontend] = None,
+        answers: Optional[AnswerProvider] = None,
+        decision_tree: Optional[DecisionTree] = None
+    ):
+        if frontend is None:
+            from frontend.rich_frontend import RichFrontend
+            frontend = RichFrontend()
+        if answers is None:
+            from answers.interactive import InteractiveAnswers
+            answers = InteractiveAnswers()
+        self.frontend = frontend
+        self.answers = answers
         self.max_questions = max_questions
-        self.countries_data = self._load_country_data()
-        self.questions = self._load_questions()
-        self.decision_tree = DecisionTree(self.countries_data)
+        if decision_tree is not None:
+            # Reuse already loaded data and precomputed tables, e.g. across load-test games
+            self.decision_tree = decision_tree.new_game()
+            self.countries_data = self.decision_tree.countries_data
+            self.questions = self.decision_tree.questions
+        else:
+            self.countries_data = self._load_country_data()
+            self.questions = self._load_questions()
+            self.decision_tree = DecisionTree(self.countries_data)
         
         # Track game state
         self.asked_questions = []
@@ -58,7 +72,7 @@ class CountryGuesser:
         
         # Ask if user is thinking of a country
         if not self._confirm_ready():
-            self.console.print("[yellow]Maybe next time then! Goodbye![/yellow]")
+            self.frontend.show_message("Maybe next time then! Goodbye!", "yellow")
             return
             
         # Start asking questions
@@ -70,13 +84,24 @@ class CountryGuesser:
             )
             
             if not question:
-                self.console.print("[yellow]I've run out of questions![/yellow]")
+                self.frontend.show_message("I've run out of questions!", "yellow")
                 break
                 
+            # A clarifying re-ask replaces an earlier answer rather than
+            # using up another question
+            clarifying = self.decision_tree.consistency.is_clarifying(question)
+            if not clarifying:
+                self.current_question_num += 1
+            
             # Ask the question and process answer
-            self.current_question_num += 1
-            answer = self._ask_question(question)
-            self.asked_questions.append((question, answer))
+            answer = self._ask_question(question, clarifying)
+            if not clarifying:
+                self.asked_questions.append((question, answer))
+            elif answer in self.decision_tree.consistency.HARD_ANSWERS:
+                self.asked_questions = [
+                    (asked, answer if asked == question else previous)
+                    for asked, previous in self.asked_questions
+                ]
             
             # Update country scores based on the answer
             self.decision_tree.update_scores(
@@ -99,32 +124,21 @@ class CountryGuesser:
         self.asked_questions = []
         self.current_question_num = 0
         self.country_scores = {country: 0 for country in self.countries_data}
+        self.decision_tree.reset()
     
     def _confirm_ready(self) -> bool:
-        return questionary.confirm(
-            "🤔 Are you thinking of a country?",
-            default=True
-        ).ask()
+        return self.answers.confirm_ready()
     
-    def _ask_question(self, question: str) -> str:
-        progress_text = f"Question {self.current_question_num}/{self.max_questions}"
-        self.console.print(f"\n[cyan]{progress_text}[/cyan]")
-        
-        # Display the question with a slight delay
-        time.sleep(0.5)
-        self.console.print(f"[bold white]{question}[/bold white]")
+    def _ask_question(self, question: str, clarifying: bool = False) -> str:
+        self.frontend.show_question(
+            self.current_question_num,
+            self.max_questions,
+            question,
+            clarifying=clarifying
+        )
         
         # Get the user's answer
-        answer = questionary.select(
-            "Your answer:",
-            choices=["Yes", "No", "Maybe", "I don't know"],
-            style=questionary.Style([
-                ('selected', 'bg:cyan fg:black'),
-                ('pointer', 'fg:cyan bold'),
-            ])
-        ).ask()
-        
-        return answer
+        return self.answers.answer_question(question)
     
     def _get_top_countries(self, n: int = 3) -> List[Tuple[str, float]]:
         # Convert scores to a list of (country, score) tuples and sort
@@ -154,19 +168,10 @@ class CountryGuesser:
         top_countries = self._get_top_countries(3)
         
         if not top_countries:
-            self.console.print("[red]I'm sorry, I couldn't guess your country.[/red]")
+            self.frontend.show_message("I'm sorry, I couldn't guess your country.", "red")
             return
             
-        # Create a spinner animation for "thinking"
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[cyan]Analyzing your answers...[/cyan]"),
-            console=self.console,
-        ) as progress:
-            progress.add_task("", total=None)
-            time.sleep(2)
-        
-        self.console.print()
+        self.frontend.show_thinking("Analyzing your answers...", 2)
         
         # Calculate confidence
         confidence = self._calculate_confidence(top_countries)
@@ -174,38 +179,22 @@ class CountryGuesser:
         
         # Make a confident guess if possible
         if confidence > 0.7:
-            guess_message = Text(f"I'm confident you're thinking of... {top_country}!")
-            self.console.print(Panel(
-                guess_message,
-                title="🎯 My Guess",
-                border_style="green",
-                expand=False
-            ))
+            self.frontend.show_guess(top_country)
         else:
             # Show multiple possibilities
-            guess_panel = Text()
-            guess_panel.append("Based on your answers, you might be thinking of:\n\n")
-            
-            for i, (country, score) in enumerate(top_countries):
-                percentage = min(100, int(score * 100 / max(1, top_score)))
-                guess_panel.append(f"{i+1}. {country} ", style="bold")
-                guess_panel.append(f"({percentage}% confidence)\n")
-                
-            self.console.print(Panel(
-                guess_panel,
-                title="🤔 My Top Guesses",
-                border_style="yellow",
-                expand=False
-            ))
+            self.frontend.show_top_guesses([
+                (country, min(100, int(score * 100 / max(1, top_score))))
+                for country, score in top_countries
+            ])
         
         # Ask if the guess was correct
-        correct = questionary.confirm(
-            "Was my guess correct?",
-            default=True
-        ).ask()
+        correct = self.answers.confirm_guess(top_country)
         
         if correct:
-            self.console.print("\n[green]Awesome! I guessed it correctly![/green] 🎉")
+            self.frontend.show_message("\nAwesome! I guessed it correctly! 🎉", "green")
+            # Only a single confident guess says which country was meant
+            if confidence > 0.7:
+                self.frontend.show_country_info(top_country, self.countries_data[top_country])
         else:
-            actual_country = questionary.text("What country were you thinking of?").ask()
-            self.console.print(f"\n[yellow]Thanks! I'll learn from this to make better guesses in the future.[/yellow]")
\ No newline at end of file
+            actual_country = self.answers.actual_country()
+            self.frontend.show_message("\nThanks! I'll learn from this to make better guesses in the future.", "yellow")
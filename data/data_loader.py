@@ -3,7 +3,7 @@ Functions for loading and managing data for the Country Guesser game
 """
 import json
 import os
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 # Default data path
 DATA_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -34,6 +34,19 @@ def load_questions() -> List[Dict[str, Any]]:
         
         return sample_questions
 
+def load_question_stats() -> Optional[Dict[str, Any]]:
+    """Load precomputed question-pair statistics, if they have been generated"""
+    try:
+        with open(os.path.join(DATA_DIR, 'question_stats.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def save_question_stats(stats: Dict[str, Any]) -> None:
+    """Write question-pair statistics alongside the dataset"""
+    with open(os.path.join(DATA_DIR, 'question_stats.json'), 'w', encoding='utf-8') as f:
+        json.dump(stats, f, indent=2)
+
 def _get_sample_questions() -> List[Dict[str, Any]]:
     """
     Return sample questions data
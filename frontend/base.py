@@ -0,0 +1,102 @@
+"""
+Frontend interface shared by the terminal renderers
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple, Any
+
+WELCOME_TITLE = "🌍 COUNTRY GUESSER 🌎"
+
+# (text, style) segments, so each renderer can apply its own styling
+WELCOME_INSTRUCTIONS = [
+    ("Think of a country and I'll try to guess it by asking you questions.\n"
+     "For each question, you can answer:\n• ", ""),
+    ("Yes", "green"), (" - if the statement is true\n• ", ""),
+    ("No", "red"), (" - if the statement is false\n• ", ""),
+    ("Maybe", "yellow"), (" - if it's partially true or you're unsure\n• ", ""),
+    ("I don't know", "blue"), (" - if you have no idea\n\nReady to begin? Let's go!", ""),
+]
+
+# Shown before re-asking a question whose answer contradicted the others
+CLARIFICATION_PROMPT = "Hmm, that doesn't fit with your earlier answers. Let me double-check:"
+
+class Frontend(ABC):
+    
+    def __init__(self, animate: bool = True):
+        # Delays and spinners are for people; disable them for scripted sessions
+        self.animate = animate
+    
+    @abstractmethod
+    def display_welcome(self) -> None:
+        ...
+    
+    @abstractmethod
+    def show_message(self, message: str, style: str = "") -> None:
+        ...
+    
+    @abstractmethod
+    def show_question(self, number: int, total: int, question: str, clarifying: bool = False) -> None:
+        ...
+    
+    @abstractmethod
+    def show_thinking(self, message: str, seconds: float) -> None:
+        ...
+    
+    @abstractmethod
+    def show_guess(self, country: str) -> None:
+        ...
+    
+    @abstractmethod
+    def show_top_guesses(self, guesses: List[Tuple[str, int]]) -> None:
+        ...
+    
+    @abstractmethod
+    def show_country_info(self, country: str, country_data: Dict[str, Any]) -> None:
+        ...
+
+def _join(value: Any) -> str:
+    if isinstance(value, list):
+        return ", ".join(value)
+    return str(value)
+
+def country_info_fields(country_data: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Return the (label, value) rows shown on a country's info card"""
+    fields = [
+        ("Location", f"{_join(country_data.get('continent', 'Unknown'))} "
+                     f"({country_data.get('hemisphere', 'Unknown')} Hemisphere)"),
+        ("Climate", _join(country_data.get("climate", "Unknown"))),
+    ]
+    
+    # Geography
+    geo_traits = []
+    if country_data.get("coastline"):
+        geo_traits.append("has coastline")
+    if country_data.get("landlocked"):
+        geo_traits.append("landlocked")
+    if country_data.get("mountains"):
+        geo_traits.append("mountainous")
+    if country_data.get("desert"):
+        geo_traits.append("has deserts")
+    if country_data.get("tropical"):
+        geo_traits.append("has tropical regions")
+    if geo_traits:
+        fields.append(("Geography", ", ".join(geo_traits)))
+    
+    # Language and culture
+    fields.append(("Language group", str(country_data.get("language_group", "Unknown"))))
+    fields.append(("Main religion", str(country_data.get("main_religion", "Unknown"))))
+    
+    # Political
+    political_traits = []
+    if country_data.get("monarchy"):
+        political_traits.append("monarchy")
+    if country_data.get("eu_member"):
+        political_traits.append("EU member")
+    if political_traits:
+        fields.append(("Political", ", ".join(political_traits)))
+    
+    if country_data.get("famous_for"):
+        fields.append(("Famous for", _join(country_data["famous_for"])))
+    if country_data.get("major_exports"):
+        fields.append(("Major exports", _join(country_data["major_exports"])))
+    
+    return fields
@@ -0,0 +1,77 @@
+"""
+Plain-text frontend that writes ANSI-coloured output without importing rich
+"""
+import sys
+import time
+from typing import Dict, List, Tuple, Any, Optional, TextIO
+
+from frontend.base import Frontend, WELCOME_TITLE, WELCOME_INSTRUCTIONS, CLARIFICATION_PROMPT, country_info_fields
+
+ANSI_CODES = {
+    "bold": "1",
+    "red": "31",
+    "green": "32",
+    "yellow": "33",
+    "blue": "34",
+    "cyan": "36",
+    "white": "37",
+}
+
+class PlainFrontend(Frontend):
+    
+    def __init__(self, file: Optional[TextIO] = None, color: Optional[bool] = None, animate: bool = True):
+        super().__init__(animate)
+        self.file = file or sys.stdout
+        if color is None:
+            color = hasattr(self.file, "isatty") and self.file.isatty()
+        self.color = color
+        self._welcome = None
+    
+    def _style(self, text: str, style: str) -> str:
+        codes = [ANSI_CODES[s] for s in style.split() if s in ANSI_CODES]
+        if not self.color or not codes:
+            return text
+        return f"\033[{';'.join(codes)}m{text}\033[0m"
+    
+    def _write(self, text: str) -> None:
+        self.file.write(text + "\n")
+    
+    def display_welcome(self) -> None:
+        if self._welcome is None:
+            instructions = "".join(self._style(segment, style) for segment, style in WELCOME_INSTRUCTIONS)
+            self._welcome = f"\n{self._style(WELCOME_TITLE, 'bold cyan')}\n\n{instructions}\n"
+        self._write(self._welcome)
+    
+    def show_message(self, message: str, style: str = "") -> None:
+        self._write(self._style(message, style))
+    
+    def show_question(self, number: int, total: int, question: str, clarifying: bool = False) -> None:
+        self._write("\n" + self._style(f"Question {number}/{total}", "cyan"))
+        if self.animate:
+            time.sleep(0.5)
+        if clarifying:
+            self.show_message(CLARIFICATION_PROMPT, "yellow")
+        self._write(self._style(question, "bold white"))
+    
+    def show_thinking(self, message: str, seconds: float) -> None:
+        if not self.animate:
+            return
+        self._write(self._style(message, "cyan"))
+        time.sleep(seconds)
+    
+    def show_guess(self, country: str) -> None:
+        self._write(self._style("🎯 My Guess: ", "bold green") +
+                    f"I'm confident you're thinking of... {country}!")
+    
+    def show_top_guesses(self, guesses: List[Tuple[str, int]]) -> None:
+        lines = [self._style("🤔 My Top Guesses", "bold yellow"),
+                 "Based on your answers, you might be thinking of:", ""]
+        for i, (country, percentage) in enumerate(guesses):
+            lines.append(f"{self._style(f'{i+1}. {country}', 'bold')} ({percentage}% confidence)")
+        self._write("\n".join(lines))
+    
+    def show_country_info(self, country: str, country_data: Dict[str, Any]) -> None:
+        lines = [self._style(country, "bold cyan"), ""]
+        for label, value in country_info_fields(country_data):
+            lines.append(f"{self._style(label + ':', 'bold')} {value}")
+        self._write("\n".join(lines))
@@ -0,0 +1,113 @@
+"""
+Frontend rendering with rich, caching the layout of everything it prints
+"""
+import time
+from typing import Callable, Dict, List, Tuple, Any, Optional, Hashable
+
+from rich.console import Console, RenderableType
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.segment import Segment, Segments
+from rich.text import Text
+
+from frontend.base import Frontend, WELCOME_TITLE, WELCOME_INSTRUCTIONS, CLARIFICATION_PROMPT
+from utils import format_country_info
+
+class RichFrontend(Frontend):
+    
+    # Laid-out segments keyed by what was drawn and the console options that
+    # shape its layout, shared by every session in the process so rich lays
+    # each one out once. Styles stay attached to the segments, so each console
+    # still renders them for its own color system.
+    _rendered: Dict[Tuple[Hashable, Tuple[int, int], bool, str], List[Segment]] = {}
+    
+    def __init__(self, console: Optional[Console] = None, animate: bool = True):
+        super().__init__(animate)
+        self.console = console or Console()
+    
+    def _print(self, key: Hashable, build: Callable[[], RenderableType]) -> None:
+        options = self.console.options
+        cache_key = (key, options.size, options.legacy_windows, options.encoding)
+        segments = RichFrontend._rendered.get(cache_key)
+        if segments is None:
+            lines = self.console.render_lines(build(), options, pad=False, new_lines=True)
+            segments = RichFrontend._rendered[cache_key] = [segment for line in lines for segment in line]
+        # Printing through the console keeps its lock, recording and color handling
+        self.console.print(Segments(segments), end="")
+    
+    def display_welcome(self) -> None:
+        self._print("welcome-spacing", lambda: Text("\n"))
+        self._print("welcome-title", lambda: Panel(
+            Text(WELCOME_TITLE, style="bold cyan"), expand=False, border_style="cyan"
+        ))
+        self._print("welcome-spacing", lambda: Text("\n"))
+        self._print("welcome-instructions", lambda: Panel(
+            self._instructions(), expand=False, border_style="white"
+        ))
+        self._print("welcome-spacing", lambda: Text("\n"))
+    
+    @staticmethod
+    def _instructions() -> Text:
+        instructions = Text()
+        for segment, style in WELCOME_INSTRUCTIONS:
+            instructions.append(segment, style=style)
+        return instructions
+    
+    def show_message(self, message: str, style: str = "") -> None:
+        self._print(("message", message, style), lambda: Text(message, style=style))
+    
+    def show_question(self, number: int, total: int, question: str, clarifying: bool = False) -> None:
+        self._print(("progress", number, total), lambda: Text(f"\nQuestion {number}/{total}", style="cyan"))
+        
+        # Display the question with a slight delay
+        if self.animate:
+            time.sleep(0.5)
+        if clarifying:
+            self.show_message(CLARIFICATION_PROMPT, "yellow")
+        self._print(("question", question), lambda: Text(question, style="bold white"))
+    
+    def show_thinking(self, message: str, seconds: float) -> None:
+        if not self.animate:
+            return
+        
+        # Create a spinner animation for "thinking"
+        with Progress(
+            SpinnerColumn(),
+            TextColumn(f"[cyan]{message}[/cyan]"),
+            console=self.console,
+        ) as progress:
+            progress.add_task("", total=None)
+            time.sleep(seconds)
+        
+        self.console.print()
+    
+    def show_guess(self, country: str) -> None:
+        self._print(("guess", country), lambda: Panel(
+            Text(f"I'm confident you're thinking of... {country}!"),
+            title="🎯 My Guess",
+            border_style="green",
+            expand=False
+        ))
+    
+    def show_top_guesses(self, guesses: List[Tuple[str, int]]) -> None:
+        # Shown once per game and different almost every time, so not worth caching
+        guess_panel = Text()
+        guess_panel.append("Based on your answers, you might be thinking of:\n\n")
+        
+        for i, (country, percentage) in enumerate(guesses):
+            guess_panel.append(f"{i+1}. {country} ", style="bold")
+            guess_panel.append(f"({percentage}% confidence)\n")
+            
+        self.console.print(Panel(
+            guess_panel,
+            title="🤔 My Top Guesses",
+            border_style="yellow",
+            expand=False
+        ))
+    
+    def show_country_info(self, country: str, country_data: Dict[str, Any]) -> None:
+        self._print(("info", country), lambda: Panel(
+            format_country_info(country, country_data),
+            border_style="cyan",
+            expand=False
+        ))
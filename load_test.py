@@ -0,0 +1,103 @@
+""" Load test that drives many concurrent CountryGuesser.play loops with scripted answers """
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+
+from answers.oracle import OracleAnswers
+from answers.scripted import ScriptedAnswers
+from country_guesser import CountryGuesser
+from data.data_loader import load_country_data
+from frontend.plain_frontend import PlainFrontend
+from logic.decision_tree import DecisionTree
+
+# Data, masks and stats are loaded once per process and shared read-only by every game
+_shared_tree: Optional[DecisionTree] = None
+
+def shared_tree() -> DecisionTree:
+    global _shared_tree
+    if _shared_tree is None:
+        _shared_tree = DecisionTree(load_country_data())
+    return _shared_tree
+
+def percentile(values: List[float], pct: float) -> float:
+    # Nearest-rank percentile
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def run_game(index: int, args: argparse.Namespace, sink) -> Dict[str, Any]:
+    tree = shared_tree()
+
+    oracle: Optional[OracleAnswers] = None
+    if args.script:
+        answers = ScriptedAnswers.from_file(args.script)
+    else:
+        countries = list(tree.countries_data)
+        answers = oracle = OracleAnswers(tree, countries[index % len(countries)])
+
+    guesser = CountryGuesser(
+        max_questions=args.max_questions,
+        frontend=PlainFrontend(file=sink, color=False, animate=False),
+        answers=answers,
+        decision_tree=tree
+    )
+
+    start = time.perf_counter()
+    guesser.play()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "latency": elapsed,
+        "questions": guesser.current_question_num,
+        "correct": oracle.guessed_correctly if oracle else None,
+    }
+
+def run_batch(indices: List[int], args: argparse.Namespace) -> List[Dict[str, Any]]:
+    # Threads interleave games within one process; they share its single core
+    shared_tree()
+    with open(os.devnull, 'w', encoding='utf-8') as sink:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            return list(executor.map(lambda i: run_game(i, args, sink), indices))
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the full Country Guesser game loop")
+    parser.add_argument("--games", type=int, default=1000, help="number of games to play")
+    parser.add_argument("--processes", type=int, default=1, help="worker processes (each uses one core)")
+    parser.add_argument("--concurrency", type=int, default=8, help="games played at once in each process")
+    parser.add_argument("--max-questions", type=int, default=20, help="question limit per game")
+    parser.add_argument("--script", help="answer file (one answer per line) instead of the trait oracle")
+    args = parser.parse_args()
+
+    batches = [list(range(args.games))[p::args.processes] for p in range(args.processes)]
+
+    start = time.perf_counter()
+    if args.processes == 1:
+        results = run_batch(batches[0], args)
+    else:
+        with ProcessPoolExecutor(max_workers=args.processes) as executor:
+            results = [r for batch in executor.map(run_batch, batches, [args] * len(batches)) for r in batch]
+    wall_time = time.perf_counter() - start
+
+    latencies_ms = [r["latency"] * 1000 for r in results]
+    total_questions = sum(r["questions"] for r in results)
+
+    print(f"Games:       {len(results)} ({args.processes} process(es) x {args.concurrency} threads)")
+    print(f"Wall time:   {wall_time:.2f}s (includes loading data once per process)")
+    print(f"Throughput:  {len(results) / wall_time:.1f} games/s, {total_questions / wall_time:.1f} questions/s "
+          f"on {args.processes} core(s); threads add concurrency, not parallelism")
+    print(f"Questions:   {total_questions / max(1, len(results)):.1f} per game")
+    print("Latency:     " + ", ".join(
+        f"p{p}={percentile(latencies_ms, p):.2f}ms" for p in (50, 90, 99)
+    ) + f", max={max(latencies_ms, default=0):.2f}ms")
+
+    graded = [r["correct"] for r in results if r["correct"] is not None]
+    if graded:
+        print(f"Accuracy:    {sum(graded) / len(graded):.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import copy
+from typing import Dict, List, Tuple, Any, Optional, Set
+
+
+class ConsistencyTracker:
+    """
+    Incremental derived state for a single game.
+
+    A hard (Yes/No) answer narrows a bitmask of the countries still consistent
+    with every answer in one integer operation. It also drops the questions
+    it fully determines or nearly duplicates (precomputed in
+    logic/question_stats.py) from the pool of questions still worth asking.
+    That step is O(k) for the k questions removed. It covers mutually
+    exclusive groups such as continents and language families as well as
+    implications across traits.
+
+    Contradictions stay off that path. Flagging one rescans the recorded
+    answers, O(answers). A re-ask that changes an answer rebuilds the derived
+    state from the remaining answers and the initial pool.
+    """
+
+    # Answers that constrain the candidate set
+    HARD_ANSWERS = {"Yes", "No"}
+
+    # Share of a question's entropy that another question must explain,
+    # I(a; b) >= threshold * H(b), for b to count as near-redundant with a
+    REDUNDANCY_THRESHOLD = 0.7
+
+    def __init__(
+        self,
+        questions: List[Dict[str, Any]],
+        match_masks: Dict[str, int],
+        all_countries_mask: int,
+        question_stats: Dict[str, Any]
+    ):
+        self.questions_by_id = {q["id"]: q for q in questions}
+        self.match_masks = match_masks
+        self.all_countries_mask = all_countries_mask
+        self.implies = {
+            qid: {answer: set(ids) for answer, ids in by_answer.items()}
+            for qid, by_answer in question_stats["implies"].items()
+        }
+
+        # Questions whose information is mostly carried by another question
+        entropy = question_stats["entropy"]
+        mutual_information = question_stats["mutual_information"]
+        self.near_redundant = {
+            a: {b for b, information in row.items()
+                if information >= self.REDUNDANCY_THRESHOLD * entropy[b]}
+            for a, row in mutual_information.items()
+        }
+
+        # Questions that can't split the countries never enter the pool. Of
+        # each group of identically or near-identically splitting questions,
+        # only the first in bank order does.
+        redundant = {qid for group in question_stats["redundant_groups"] for qid in group[1:]}
+        representatives: Set[str] = set()
+        self.initial_pool = []
+        for q in questions:
+            qid = q["id"]
+            if entropy[qid] <= 0 or qid in redundant:
+                continue
+            if any(
+                other in representatives
+                and information >= self.REDUNDANCY_THRESHOLD * max(entropy[qid], entropy[other])
+                for other, information in mutual_information[qid].items()
+            ):
+                continue
+            representatives.add(qid)
+            self.initial_pool.append(qid)
+
+        self.reset()
+
+    def reset(self) -> None:
+        self.answered: Set[str] = set()
+        self.implied: Set[str] = set()
+        self.confirmed: Dict[str, str] = {}
+        self.constraints: List[Tuple[str, str]] = []
+        self.candidates_mask = self.all_countries_mask
+
+        # Questions still worth asking, in bank order
+        self.remaining: Dict[str, None] = dict.fromkeys(self.initial_pool)
+
+        # Question id to re-ask -> id of the answer it conflicted with
+        self.pending_clarifications: Dict[str, str] = {}
+        self.clarifying: Optional[str] = None
+        self.clarified: Set[str] = set()
+
+    def new_game(self) -> "ConsistencyTracker":
+        tracker = copy.copy(self)
+        tracker.reset()
+        return tracker
+
+    def record_answer(self, question: Dict[str, Any], answer: str) -> None:
+        qid = question["id"]
+
+        if qid == self.clarifying:
+            self._resolve_clarification(qid, answer)
+            return
+
+        self.answered.add(qid)
+        self.remaining.pop(qid, None)
+        if answer not in self.HARD_ANSWERS:
+            return
+
+        self.constraints.append((qid, answer))
+        self._derive(qid, answer)
+
+        # Only flag the transition to an empty candidate set; once every
+        # known country is ruled out, further answers can't add information
+        before = self.candidates_mask
+        self.candidates_mask = self._apply(before, qid, answer)
+        if before and not self.candidates_mask:
+            self._flag_contradiction(qid)
+
+    def next_clarification(self) -> Optional[str]:
+        if self.clarifying is None and self.pending_clarifications:
+            self.clarifying = next(iter(self.pending_clarifications))
+        if self.clarifying is None:
+            return None
+        return self.questions_by_id[self.clarifying]["text"]
+
+    def is_clarifying(self, question_text: str) -> bool:
+        if self.clarifying is None:
+            return False
+        return self.questions_by_id[self.clarifying]["text"] == question_text
+
+    def last_answer(self, question_id: str) -> Optional[str]:
+        for qid, answer in reversed(self.constraints):
+            if qid == question_id:
+                return answer
+        return None
+
+    def _apply(self, mask: int, qid: str, answer: str) -> int:
+        if answer == "Yes":
+            return mask & self.match_masks[qid]
+        return mask & ~self.match_masks[qid]
+
+    def _flag_contradiction(self, latest_id: str) -> None:
+        # Find the most recent earlier answer that, if it were wrong, would
+        # leave at least one country consistent with everything else
+        count = len(self.constraints)
+        prefix = [self.all_countries_mask]
+        for qid, answer in self.constraints:
+            prefix.append(self._apply(prefix[-1], qid, answer))
+
+        suffix = self.all_countries_mask
+        suspect = latest_id
+        for i in range(count - 1, -1, -1):
+            qid, answer = self.constraints[i]
+            if i < count - 1 and qid not in self.clarified and prefix[i] & suffix:
+                suspect = qid
+                break
+            suffix = self._apply(suffix, qid, answer)
+
+        if suspect not in self.clarified:
+            self.pending_clarifications[suspect] = latest_id
+
+    def _resolve_clarification(self, qid: str, answer: str) -> None:
+        self.pending_clarifications.pop(qid, None)
+        self.clarifying = None
+        self.clarified.add(qid)
+
+        previous = self.last_answer(qid)
+        if answer not in self.HARD_ANSWERS or answer == previous:
+            # The earlier answer stands; the country is likely outside our data
+            return
+
+        # The user changed their mind, so rebuild the derived state without
+        # the retracted answer
+        constraints = [(q, a) for q, a in self.constraints if q != qid]
+        constraints.append((qid, answer))
+        self.constraints = constraints
+
+        self.candidates_mask = self.all_countries_mask
+        self.confirmed = {}
+        self.implied = set()
+        for q, a in constraints:
+            self.candidates_mask = self._apply(self.candidates_mask, q, a)
+            self._derive(q, a)
+        self.remaining = {
+            q: None for q in self.initial_pool
+            if q not in self.answered and q not in self.implied
+        }
+
+    def _derive(self, qid: str, answer: str) -> None:
+        # A hard answer settles the questions it fully determines in the data,
+        # and leaves little to learn from the near-redundant ones
+        implied = self.implies[qid][answer] | self.near_redundant[qid]
+        self.implied |= implied
+        for other in implied:
+            self.remaining.pop(other, None)
+        if answer == "Yes":
+            self.confirmed.setdefault(self.questions_by_id[qid]["trait"], qid)
@@ -1,10 +1,22 @@
 from typing import Dict, List, Tuple, Any, Optional, Set
+import copy
 import random
 
+from data.data_loader import load_questions, load_question_stats
+from logic.consistency import ConsistencyTracker
+from logic.question_stats import compute_question_stats, trait_fingerprint, STATS_VERSION
+
 class DecisionTree:
     
-    def __init__(self, countries_data: Dict[str, Dict[str, Any]]):
+    def __init__(
+        self,
+        countries_data: Dict[str, Dict[str, Any]],
+        questions: Optional[List[Dict[str, Any]]] = None
+    ):
         self.countries_data = countries_data
+        self.questions = questions if questions is not None else load_questions()
+        self.questions_by_id = {q["id"]: q for q in self.questions}
+        self.questions_by_text = {q["text"]: q for q in self.questions}
         
         # Score weights for different answers
         self.score_weights = {
@@ -24,19 +36,66 @@ class DecisionTree:
             "continent_oceania"
         }
         
+        # One bit per country, so constraint checks are single integer operations
+        self.country_bits = {country: 1 << i for i, country in enumerate(countries_data)}
+        self.match_masks = {
+            q["id"]: self._match_mask(q["trait"], q["match_value"])
+            for q in self.questions
+        }
+        self.question_stats = self._load_question_stats()
+        
+        self.consistency = ConsistencyTracker(
+            self.questions,
+            self.match_masks,
+            (1 << len(countries_data)) - 1,
+            self.question_stats
+        )
+        
+        # Number of candidate questions scored this game, for benchmarking
+        self.candidates_evaluated = 0
+        
+    def reset(self) -> None:
+        self.consistency.reset()
+        self.candidates_evaluated = 0
+        
+    def new_game(self) -> "DecisionTree":
+        # Share the read-only data and precomputed tables; only the tracker is per game
+        tree = copy.copy(self)
+        tree.consistency = self.consistency.new_game()
+        return tree
+        
+    def _load_question_stats(self) -> Dict[str, Any]:
+        stats = load_question_stats()
+        
+        # Fall back to computing in memory if the offline pass is missing or stale
+        if (not stats
+                or stats.get("version") != STATS_VERSION
+                or stats.get("countries") != list(self.countries_data)
+                or stats.get("questions") != [q["id"] for q in self.questions]
+                or stats.get("fingerprint") != trait_fingerprint(
+                    list(self.countries_data),
+                    [q["id"] for q in self.questions],
+                    self.match_masks
+                )):
+            stats = compute_question_stats(
+                list(self.countries_data),
+                self.questions,
+                self.match_masks
+            )
+        return stats
+        
     def get_next_question(
         self, 
         asked_questions: List[Tuple[str, str]], 
         country_scores: Dict[str, float]
     ) -> Optional[str]:
-        from data.data_loader import load_questions
-        
-        # Get all questions
-        all_questions = load_questions()
+        # Re-ask an earlier question first if the answers contradict each other
+        clarification = self.consistency.next_clarification()
+        if clarification:
+            return clarification
         
-        # Filter out already asked questions
-        asked_question_ids = {q for q, _ in asked_questions}
-        available_questions = [q for q in all_questions if q["id"] not in asked_question_ids]
+        # Only questions not yet asked or implied by earlier answers remain
+        available_questions = [self.questions_by_id[qid] for qid in self.consistency.remaining]
         
         if not available_questions:
             return None
@@ -55,40 +114,22 @@ class DecisionTree:
             reverse=True
         )[:5]  # Focus on top 5 countries
         
-        # If we have narrowed down continents, avoid asking continent questions
-        continent_narrowed = False
-        for question, answer in asked_questions:
-            for q in all_questions:
-                if q["text"] == question and q["id"] in self.continent_questions and answer == "Yes":
-                    continent_narrowed = True
-        
         # If we've narrowed down to a continent, don't ask more continent questions
-        if continent_narrowed:
+        if "continent" in self.consistency.confirmed:
             available_questions = [q for q in available_questions 
                                   if q["id"] not in self.continent_questions]
         
         # Skip questions that would no longer be useful
         useful_questions = []
+        top_mask = 0
+        for country, _ in top_countries:
+            top_mask |= self.country_bits[country]
         
+        self.candidates_evaluated += len(available_questions)
         for question in available_questions:
-            # Calculate potential information gain
-            trait = question["trait"]
-            match_value = question["match_value"]
-            
-            # Skip if trait not relevant to top countries
-            if all(trait not in self.countries_data[country] for country, _ in top_countries):
-                continue
-                
             # Check if question would be informative
-            potential_yes = 0
-            potential_no = 0
-            
-            for country, _ in top_countries:
-                country_data = self.countries_data[country]
-                if self._check_trait_match(country_data, trait, match_value):
-                    potential_yes += 1
-                else:
-                    potential_no += 1
+            potential_yes = bin(self.match_masks[question["id"]] & top_mask).count("1")
+            potential_no = len(top_countries) - potential_yes
             
             # Only ask if question could split the top countries
             if potential_yes > 0 and potential_no > 0:
@@ -112,20 +153,32 @@ class DecisionTree:
         answer: str,
         country_scores: Dict[str, float]
     ) -> None:
-        from data.data_loader import load_questions
-        
         # Find the question details
-        all_questions = load_questions()
-        question_data = None
-        
-        for q in all_questions:
-            if q["text"] == question:
-                question_data = q
-                break
+        question_data = self.questions_by_text.get(question)
                 
         if not question_data:
             return
-            
+        
+        # A re-asked question replaces the earlier answer instead of adding to it
+        question_id = question_data["id"]
+        if self.consistency.clarifying == question_id:
+            previous = self.consistency.last_answer(question_id)
+            self.consistency.record_answer(question_data, answer)
+            if answer not in self.consistency.HARD_ANSWERS or answer == previous:
+                return
+            self._apply_answer(question_data, previous, country_scores, sign=-1.0)
+        else:
+            self.consistency.record_answer(question_data, answer)
+        
+        self._apply_answer(question_data, answer, country_scores)
+    
+    def _apply_answer(
+        self,
+        question_data: Dict[str, Any],
+        answer: str,
+        country_scores: Dict[str, float],
+        sign: float = 1.0
+    ) -> None:
         # Get the trait and match value
         trait = question_data["trait"]
         match_value = question_data["match_value"]
@@ -142,23 +195,30 @@ class DecisionTree:
             if trait_matches:
                 # If trait matches and answer is Yes, increase score
                 if answer == "Yes":
-                    country_scores[country] += weight
+                    country_scores[country] += sign * weight
                 # If trait matches but answer is No, decrease score
                 elif answer == "No":
-                    country_scores[country] -= 1.0
+                    country_scores[country] -= sign * 1.0
                 # If Maybe, smaller adjustment
                 elif answer == "Maybe":
-                    country_scores[country] += weight
+                    country_scores[country] += sign * weight
             else:
                 # If trait doesn't match and answer is No, increase score
                 if answer == "No":
-                    country_scores[country] += abs(weight)
+                    country_scores[country] += sign * abs(weight)
                 # If trait doesn't match but answer is Yes, decrease score
                 elif answer == "Yes":
-                    country_scores[country] -= 1.0
+                    country_scores[country] -= sign * 1.0
                 # If Maybe, smaller adjustment
                 elif answer == "Maybe":
-                    country_scores[country] -= weight * 0.5
+                    country_scores[country] -= sign * weight * 0.5
+    
+    def _match_mask(self, trait: str, match_value: Any) -> int:
+        mask = 0
+        for country, country_data in self.countries_data.items():
+            if self._check_trait_match(country_data, trait, match_value):
+                mask |= self.country_bits[country]
+        return mask
     
     def _check_trait_match(
         self, 
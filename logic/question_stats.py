@@ -0,0 +1,108 @@
+"""
+Offline question-pair statistics over the country trait matrix
+
+Run `python -m logic.question_stats` after editing the dataset to refresh
+data/question_stats.json.
+"""
+import hashlib
+import math
+from typing import Dict, List, Any
+
+# Bump whenever the layout of the statistics changes
+STATS_VERSION = 4
+
+# Pairs sharing less mutual information than this (in bits) are left out
+MIN_MUTUAL_INFORMATION = 0.01
+
+def compute_question_stats(
+    countries: List[str],
+    questions: List[Dict[str, Any]],
+    match_masks: Dict[str, int]
+) -> Dict[str, Any]:
+    """Compute per-question entropy, pairwise mutual information, conditional implications and redundancy"""
+    total = len(countries)
+    all_mask = (1 << total) - 1
+    ids = [q["id"] for q in questions]
+
+    entropy = {qid: _entropy([_count(match_masks[qid]), total - _count(match_masks[qid])])
+               for qid in ids}
+
+    # For each answer to `a`, the questions whose answer it fixes for every
+    # remaining country, i.e. H(b | a = answer) == 0. Asking them afterwards
+    # gains no information.
+    implies: Dict[str, Dict[str, List[str]]] = {qid: {"Yes": [], "No": []} for qid in ids}
+    mutual_information: Dict[str, Dict[str, float]] = {qid: {} for qid in ids}
+
+    for a in ids:
+        inside_a = match_masks[a]
+        outside_a = all_mask & ~inside_a
+        for b in ids:
+            if a == b:
+                continue
+            mask_b = match_masks[b]
+
+            # I(a; b) = H(a) + H(b) - H(a, b), stored sparsely
+            both = _count(inside_a & mask_b)
+            only_a = _count(inside_a) - both
+            only_b = _count(mask_b) - both
+            joint = _entropy([both, only_a, only_b, total - both - only_a - only_b])
+            information = entropy[a] + entropy[b] - joint
+            if information >= MIN_MUTUAL_INFORMATION:
+                mutual_information[a][b] = round(information, 4)
+
+            if mask_b & inside_a in (0, inside_a):
+                implies[a]["Yes"].append(b)
+            if mask_b & outside_a in (0, outside_a):
+                implies[a]["No"].append(b)
+
+    # Questions that split the countries identically (or exactly inversely)
+    groups: Dict[int, List[str]] = {}
+    for qid in ids:
+        mask = match_masks[qid]
+        if mask in (0, all_mask):
+            continue
+        groups.setdefault(min(mask, all_mask & ~mask), []).append(qid)
+
+    return {
+        "version": STATS_VERSION,
+        "countries": list(countries),
+        "questions": ids,
+        # Edits to any trait change the fingerprint and invalidate the file
+        "fingerprint": trait_fingerprint(countries, ids, match_masks),
+        "entropy": {qid: round(value, 4) for qid, value in entropy.items()},
+        "mutual_information": mutual_information,
+        "implies": implies,
+        "redundant_groups": [group for group in groups.values() if len(group) > 1]
+    }
+
+
+def trait_fingerprint(countries: List[str], ids: List[str], match_masks: Dict[str, int]) -> str:
+    """Hash the trait matrix; masks are hashed as hex, as large banks exceed JSON's int digit limit"""
+    digest = hashlib.sha256()
+    for country in countries:
+        digest.update(country.encode("utf-8") + b"\0")
+    for qid in ids:
+        digest.update(f"{qid}\0{match_masks[qid]:x}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _count(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def _entropy(counts: List[int]) -> float:
+    total = sum(counts)
+    if not total:
+        return 0.0
+    return -sum(c / total * math.log2(c / total) for c in counts if c)
+
+
+if __name__ == "__main__":
+    from data.data_loader import load_country_data, save_question_stats
+    from logic.decision_tree import DecisionTree
+
+    tree = DecisionTree(load_country_data())
+    stats = compute_question_stats(list(tree.countries_data), tree.questions, tree.match_masks)
+    save_question_stats(stats)
+    print(f"Wrote statistics for {len(stats['questions'])} questions "
+          f"({len(stats['redundant_groups'])} redundant groups)")
@@ -0,0 +1,119 @@
+import io
+import random
+import unittest
+from typing import Dict, List, Optional, Tuple
+
+from answers.base import AnswerProvider
+from country_guesser import CountryGuesser
+from data.data_loader import load_country_data
+from frontend.plain_frontend import PlainFrontend
+from logic.decision_tree import DecisionTree
+
+
+class MappedAnswers(AnswerProvider):
+    """Answer by question id, "No" for anything unmapped"""
+
+    def __init__(self, tree: DecisionTree, answers: Dict[str, str]):
+        self.tree = tree
+        self.answers = answers
+
+    def confirm_ready(self) -> bool:
+        return True
+
+    def answer_question(self, question: str) -> str:
+        return self.answers.get(self.tree.questions_by_text[question]["id"], "No")
+
+    def confirm_guess(self, country: str) -> bool:
+        return False
+
+    def actual_country(self) -> Optional[str]:
+        return None
+
+
+class ConsistencyTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.shared_tree = DecisionTree(load_country_data())
+
+    def setUp(self):
+        self.tree = self.shared_tree.new_game()
+        self.scores = {country: 0 for country in self.tree.countries_data}
+
+    def answer(self, question_id: str, answer: str) -> None:
+        question = self.tree.questions_by_id[question_id]["text"]
+        self.tree.update_scores(question, answer, self.scores)
+
+    def clean_run(self, answers: List[Tuple[str, str]]) -> Dict[str, float]:
+        tree = self.shared_tree.new_game()
+        scores = {country: 0 for country in tree.countries_data}
+        for question_id, answer in answers:
+            tree.update_scores(tree.questions_by_id[question_id]["text"], answer, scores)
+        return scores
+
+    def contradict(self) -> None:
+        # Europe and not in the EU leaves only Russia, which isn't a monarchy
+        self.answer("continent_europe", "Yes")
+        self.answer("eu_member", "No")
+        self.answer("monarchy", "Yes")
+
+    def test_contradiction_re_asks_the_suspect_answer(self):
+        self.contradict()
+        clarification = self.tree.get_next_question([], self.scores)
+        self.assertEqual(clarification, self.tree.questions_by_id["eu_member"]["text"])
+        self.assertTrue(self.tree.consistency.is_clarifying(clarification))
+
+    def test_changed_answer_matches_a_clean_run(self):
+        self.contradict()
+        self.tree.get_next_question([], self.scores)
+        self.answer("eu_member", "Yes")
+
+        expected = self.clean_run([
+            ("continent_europe", "Yes"),
+            ("eu_member", "Yes"),
+            ("monarchy", "Yes"),
+        ])
+        self.assertEqual(self.scores, expected)
+        self.assertIsNone(self.tree.consistency.clarifying)
+        self.assertTrue(self.tree.consistency.candidates_mask)
+
+    def test_confirmed_answer_leaves_scores_unchanged(self):
+        self.contradict()
+        before = dict(self.scores)
+        self.tree.get_next_question([], self.scores)
+        self.answer("eu_member", "No")
+
+        self.assertEqual(self.scores, before)
+        self.assertIsNone(self.tree.consistency.next_clarification())
+
+    def test_re_ask_does_not_use_up_a_question(self):
+        # Sweden except for EU membership, which no country in the data matches
+        answers = MappedAnswers(self.shared_tree, {
+            "continent_europe": "Yes",
+            "monarchy": "Yes",
+            "northern_hemisphere": "Yes",
+            "mountains": "Yes",
+        })
+
+        # Whether the game runs into the contradiction depends on the random
+        # opening question, so play a few games and check every one
+        re_asked = 0
+        for seed in range(10):
+            random.seed(seed)
+            guesser = CountryGuesser(
+                max_questions=20,
+                frontend=PlainFrontend(file=io.StringIO(), animate=False),
+                answers=answers,
+                decision_tree=self.shared_tree
+            )
+            guesser.play()
+
+            asked = [question for question, _ in guesser.asked_questions]
+            self.assertEqual(len(asked), len(set(asked)))
+            self.assertEqual(guesser.current_question_num, len(asked))
+            re_asked += bool(guesser.decision_tree.consistency.clarified)
+
+        self.assertGreater(re_asked, 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
+from frontend.base import country_info_fields
+
 def animate_text(console: Console, text: str, delay: float = 0.03) -> None:
     for char in text:
         console.print(char, end="", highlight=False)
@@ -29,78 +31,10 @@ def format_country_info(country: str, country_data: Dict[str, Any]) -> Text:
     text = Text()
     text.append(f"{country}\n\n", style="bold cyan")
     
-    # Add basic info
-    text.append("Location: ", style="bold")
-    if isinstance(country_data.get("continent"), list):
-        text.append(", ".join(country_data["continent"]))
-    else:
-        text.append(str(country_data.get("continent", "Unknown")))
-    text.append(" (")
-    text.append(str(country_data.get("hemisphere", "Unknown")))
-    text.append(" Hemisphere)\n")
-    
-    # Climate
-    text.append("Climate: ", style="bold")
-    if isinstance(country_data.get("climate"), list):
-        text.append(", ".join(country_data["climate"]))
-    else:
-        text.append(str(country_data.get("climate", "Unknown")))
-    text.append("\n")
-    
-    # Geography
-    geo_traits = []
-    if country_data.get("coastline"):
-        geo_traits.append("has coastline")
-    if country_data.get("landlocked"):
-        geo_traits.append("landlocked")
-    if country_data.get("mountains"):
-        geo_traits.append("mountainous")
-    if country_data.get("desert"):
-        geo_traits.append("has deserts")
-    if country_data.get("tropical"):
-        geo_traits.append("has tropical regions")
-    
-    if geo_traits:
-        text.append("Geography: ", style="bold")
-        text.append(", ".join(geo_traits))
-        text.append("\n")
-    
-    # Language and culture
-    text.append("Language group: ", style="bold")
-    text.append(str(country_data.get("language_group", "Unknown")))
-    text.append("\n")
-    
-    text.append("Main religion: ", style="bold")
-    text.append(str(country_data.get("main_religion", "Unknown")))
-    text.append("\n")
-    
-    # Political
-    political_traits = []
-    if country_data.get("monarchy"):
-        political_traits.append("monarchy")
-    if country_data.get("eu_member"):
-        political_traits.append("EU member")
-    
-    if political_traits:
-        text.append("Political: ", style="bold")
-        text.append(", ".join(political_traits))
-        text.append("\n")
-    
-    # Famous for
-    if country_data.get("famous_for"):
-        text.append("Famous for: ", style="bold")
-        if isinstance(country_data["famous_for"], list):
-            text.append(", ".join(country_data["famous_for"]))
-        else:
-            text.append(str(country_data["famous_for"]))
-        text.append("\n")
-    
-    # Exports
-    if country_data.get("major_exports"):
-        text.append("Major exports: ", style="bold")
-        if isinstance(country_data["major_exports"], list):
-            text.append(", ".join(country_data["major_exports"]))
-        else:
-            text.append(str(country_data["major_exports"]))
+    rows = [
+        Text.assemble((f"{label}: ", "bold"), value)
+        for label, value in country_info_fields(country_data)
+    ]
+    text.append(Text("\n").join(rows))
     
-    return text
\ No newline at end of file
+    return text